@@ -1,5 +1,7 @@
 from stock_animator.core.data_fetcher import DataHandler
 from stock_animator.core.portfolio_calculator import PortfolioCalculator
+from stock_animator.core.entry_sweep import EntryDateSweep
+from stock_animator.core.multi_asset_plan import MultiAssetPlanCalculator
 from stock_animator.visualization.animator import AnimationBuilder
 from stock_animator.visualization.formatters import CurrencyFormatter
 from stock_animator.cli.prompts import CLIPrompter
@@ -10,6 +12,8 @@ class StockAnimatorCLI:
         self.config = AnimationConfig
         self.data_handler = DataHandler()
         self.portfolio_calculator = PortfolioCalculator(self.data_handler)
+        self.entry_sweep = EntryDateSweep()
+        self.multi_asset_calculator = MultiAssetPlanCalculator(self.data_handler)
         self.animator = AnimationBuilder()
         
     def run(self):
@@ -21,9 +25,16 @@ class StockAnimatorCLI:
             choice = CLIPrompter.get_visualization_mode()
             if choice == 'Q':
                 break
+            if choice == 'A':
+                self._handle_multi_asset(formatter)
+                continue
             stock_symbol = CLIPrompter.get_stock_symbol()
             start_str, end_str = CLIPrompter.get_date_range()
-            data = self._initialize_data(stock_symbol, start_str, end_str)
+            if choice == 'E':
+                # The sweep works on the raw trading days, not the interpolated frames
+                data = self.data_handler.fetch_stock_data(stock_symbol, start_str, end_str)
+            else:
+                data = self._initialize_data(stock_symbol, start_str, end_str)
             self._handle_choice(choice, data, formatter, stock_symbol)
 
     def _initialize_data(self, stock_symbol, start_str, end_str):
@@ -36,7 +47,8 @@ class StockAnimatorCLI:
         handlers = {
             'P': self._handle_price,
             'S': self._handle_single,
-            'M': self._handle_monthly
+            'M': self._handle_monthly,
+            'E': self._handle_sweep
         }
         handlers.get(choice, self._handle_invalid)(data, formatter, stock_symbol)
 
@@ -56,6 +68,37 @@ class StockAnimatorCLI:
         portfolio_data = self.portfolio_calculator.calculate(data, amount)
         self.animator.create_animation(portfolio_data, stock_symbol, formatter, show_invested=show_invested)
 
+    def _handle_sweep(self, data, formatter, stock_symbol):
+        """Handle single investment sweep over all entry dates"""
+        amount = CLIPrompter.get_investment_amount("Initial investment amount (e.g. 1000): ")
+        sweep = self.entry_sweep.calculate(data, amount)
+        if sweep.empty:
+            print("Date range is too short for the shortest holding period.")
+            return
+        summary = self.entry_sweep.summarize(sweep)
+        summary.to_csv(self.config.OUTPUT_DIR / f"{stock_symbol}_entry_sweep.csv")
+        print(summary.to_string())
+        self.animator.create_sweep_animation(sweep, stock_symbol, formatter)
+
+    def _handle_multi_asset(self, formatter):
+        """Handle multi-asset savings plan with target weights"""
+        weights = CLIPrompter.get_weighted_symbols()
+        start_str, end_str = CLIPrompter.get_date_range()
+        amount = CLIPrompter.get_investment_amount("Monthly investment amount (e.g. 500): ")
+        rebalance = CLIPrompter.get_rebalance_frequency()
+        stacked = CLIPrompter.confirm("Stack the asset lines?")
+        show_invested = CLIPrompter.confirm("Show total invested line?")
+
+        prices = self.data_handler.fetch_close_prices(list(weights), start_str, end_str)
+        if prices.empty:
+            print("No overlapping price data for the selected symbols.")
+            return
+        portfolio_data = self.multi_asset_calculator.calculate(prices, weights, amount, rebalance)
+        self.animator.create_animation(portfolio_data, 'PORTFOLIO', formatter,
+                                       asset_columns=list(prices.columns),
+                                       stacked=stacked,
+                                       show_invested=show_invested)
+
     def _handle_invalid(self, *args):
         print("Invalid selection")
 
@@ -17,8 +17,10 @@ class CLIPrompter:
         print("  P: Show stock price only")
         print("  S: Simulate single initial investment")
         print("  M: Simulate monthly investments")
+        print("  E: Compare single investments over all entry dates")
+        print("  A: Simulate a multi-asset savings plan")
         print("  Q: Quit")
-        return input("Enter choice (P/S/M/Q): ").strip().upper()
+        return input("Enter choice (P/S/M/E/A/Q): ").strip().upper()
 
     @staticmethod
     def get_investment_amount(prompt):
@@ -38,6 +40,33 @@ class CLIPrompter:
         symbol = input("Enter stock symbol (e.g. AMZN): ").strip().upper()
         return symbol
     
+    @staticmethod
+    def get_weighted_symbols():
+        """Get symbols with target weights, e.g. VOO:60, VXUS:30, BND:10"""
+        while True:
+            entries = input("Enter symbols with weights (e.g. VOO:60, VXUS:30, BND:10): ")
+            try:
+                weights = {}
+                for entry in entries.split(','):
+                    symbol, _, weight = entry.partition(':')
+                    weights[symbol.strip().upper()] = float(weight) if weight.strip() else 1.0
+                if '' not in weights and all(w >= 0 for w in weights.values()) and sum(weights.values()) > 0:
+                    return weights
+                print("Enter at least one symbol with a positive weight.")
+            except ValueError:
+                print("Invalid weight format.")
+
+    @staticmethod
+    def get_rebalance_frequency():
+        """Get rebalancing frequency, None for never"""
+        while True:
+            choice = input("Rebalance (N: never, M: monthly, Q: quarterly, Y: yearly): ").strip().upper()
+            if choice == 'N':
+                return None
+            if choice in ['M', 'Q', 'Y']:
+                return choice
+            print("Invalid selection.")
+
     @staticmethod
     def get_date_range():
         """Get start and end date in YYYY-MM-DD format"""
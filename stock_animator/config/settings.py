@@ -1,4 +1,6 @@
+from collections import namedtuple
 from pathlib import Path
+from types import MappingProxyType
 
 class AnimationConfig:
     # Technical Settings
@@ -6,6 +8,8 @@ class AnimationConfig:
     TARGET_DURATION = 60  # in seconds
     TARGET_FRAMES = TARGET_FPS * TARGET_DURATION
     OUTPUT_DIR = Path("output")
+    OUTPUT_FORMAT = 'mp4'  # 'mp4', or 'hls'/'fmp4' to make the video playable while rendering
+    SEGMENT_SECONDS = 2  # Length of HLS segments and fMP4 fragments
     
     # Visual Settings
     FIGURE_SIZE = (10.8, 19.2)
@@ -28,4 +32,41 @@ class AnimationConfig:
     X_OFFSET_PCT = 0.02
     Y_MARGIN_PCT = 0.1
     INVESTMENT_SMOOTHING_FRAMES = 10
-    SCALING_FACTOR = 0.1
\ No newline at end of file
+    SCALING_FACTOR = 0.1
+    
+    # Entry Date Sweep
+    SWEEP_HOLDING_YEARS = (1, 3, 5, 10, 20)
+    SWEEP_COLORMAP = 'RdYlGn'
+    SWEEP_COLOR_LIMIT = 0.3  # Annualized return mapped to the ends of the colormap
+
+    # Multi-Asset Plans
+    ASSET_COLORMAP = 'tab20'
+    ASSET_LEGEND_LIMIT = 10  # More assets than this are drawn without a legend
+    
+    # Render Daemon
+    DAEMON_HOST = '127.0.0.1'
+    DAEMON_PORT = 8765
+    DAEMON_WORKERS = 2
+    DAEMON_JOB_TTL = 3600  # Seconds a finished job stays queryable
+    
+    # Data Cache
+    CACHE_MAX_ENTRIES = 32
+    CACHE_MAX_BYTES = 256 * 1024 * 1024
+    PREFETCH_DELAY_MS = 400  # Wait for input to settle before downloading
+
+
+def freeze_config(config=AnimationConfig, **overrides):
+    """Immutable snapshot of a config class (or snapshot) for a single render job"""
+    values = {name: getattr(config, name) for name in dir(config) if name.isupper()}
+    values.update(overrides)
+    values = {name: MappingProxyType(dict(value)) if isinstance(value, dict) else value
+              for name, value in values.items()}
+    return namedtuple('FrozenAnimationConfig', values)(**values)
+
+
+def output_path(symbol, suffix='animation', output_format=None, config=AnimationConfig):
+    """Where a render is written; for HLS this is the playlist next to its segments"""
+    output_format = output_format or config.OUTPUT_FORMAT
+    if output_format == 'hls':
+        return Path(config.OUTPUT_DIR) / f'{symbol}_{suffix}' / 'playlist.m3u8'
+    return Path(config.OUTPUT_DIR) / f'{symbol}_{suffix}.mp4'
@@ -0,0 +1,49 @@
+import threading
+from collections import OrderedDict
+from stock_animator.config.settings import AnimationConfig
+
+class DataCache:
+    """Thread-safe LRU cache of prepared price data, bounded by entries and memory"""
+
+    def __init__(self, config=AnimationConfig):
+        self.config = config
+        self._entries = OrderedDict()
+        self._sizes = {}
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(symbol, start, end):
+        return (symbol.upper(), start, end)
+
+    def get(self, key):
+        """Return a copy of the cached data, so callers may add columns freely"""
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                return None
+            self._entries.move_to_end(key)
+            return data.copy()
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def put(self, key, data):
+        """Store data and evict the least recently used entries beyond the limits"""
+        size = int(data.memory_usage(deep=True).sum())
+        if size > self.config.CACHE_MAX_BYTES:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = data
+            self._sizes[key] = size
+            self._total_bytes += size
+            while (len(self._entries) > self.config.CACHE_MAX_ENTRIES
+                   or self._total_bytes > self.config.CACHE_MAX_BYTES):
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key):
+        del self._entries[key]
+        self._total_bytes -= self._sizes.pop(key)
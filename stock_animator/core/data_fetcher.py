@@ -1,9 +1,13 @@
+import threading
 import yfinance as yf
 import pandas as pd
 from pathlib import Path
 from stock_animator.config.settings import AnimationConfig
 
 class DataHandler:
+    # yf.download collects results in module-global state, so only one download may run at a time
+    _download_lock = threading.Lock()
+
     def __init__(self, config=AnimationConfig):
         self.config = config
         self._ensure_output_dir()
@@ -13,13 +17,29 @@ class DataHandler:
         
     def fetch_stock_data(self, symbol, start, end):
         """Fetch stock data from Yahoo Finance"""
-        data = yf.download(
-            symbol, 
-            start=start, 
-            end=end,
-            auto_adjust=True
-            )
+        with self._download_lock:
+            data = yf.download(
+                symbol, 
+                start=start, 
+                end=end,
+                auto_adjust=True
+                )
         return data
+
+    def fetch_close_prices(self, symbols, start, end):
+        """Fetch close prices of several symbols aligned on common trading days"""
+        with self._download_lock:
+            data = yf.download(
+                list(symbols),
+                start=start,
+                end=end,
+                auto_adjust=True
+                )
+        closes = data['Close']
+        if isinstance(closes, pd.Series):
+            closes = closes.to_frame(symbols[0])
+        # Carry prices over holidays of single exchanges, start once every symbol trades
+        return closes[list(symbols)].ffill().dropna()
     
     def interpolate_data(self, data):
         """Interpolate data to target frame count"""
@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+from stock_animator.config.settings import AnimationConfig
+
+class EntryDateSweep:
+    def __init__(self, config=AnimationConfig):
+        self.config = config
+
+    def calculate(self, data, start_capital, holding_years=None):
+        """Evaluate a single investment for every entry date and holding period"""
+        holding_years = holding_years or self.config.SWEEP_HOLDING_YEARS
+        closes = self._get_closes(data)
+        dates = closes.index
+        prices = closes.to_numpy()
+
+        results = {}
+        for years in holding_years:
+            label = self._period_label(years)
+            exit_pos = self._get_exit_positions(dates, years)
+            valid = exit_pos < len(dates)
+
+            total_return = np.full(len(dates), np.nan)
+            total_return[valid] = prices[exit_pos[valid]] / prices[valid] - 1
+
+            results[('Return', label)] = total_return
+            results[('Annualized', label)] = (1 + total_return) ** (1 / years) - 1
+            results[('End_Value', label)] = (1 + total_return) * start_capital
+
+        sweep = pd.DataFrame(results, index=dates)
+        sweep.columns = pd.MultiIndex.from_tuples(sweep.columns)
+        # Periods longer than the data and entries that cannot complete even the
+        # shortest holding period carry no information
+        return sweep.dropna(axis=1, how='all').dropna(how='all')
+
+    def summarize(self, sweep):
+        """Aggregate the sweep into one row per holding period"""
+        rows = {}
+        for label in sweep['Return'].columns:
+            returns = sweep['Return'][label].dropna()
+            if returns.empty:
+                continue
+            rows[label] = {
+                'Entries': len(returns),
+                'Worst': returns.min(),
+                'Median': returns.median(),
+                'Mean': returns.mean(),
+                'Best': returns.max(),
+                'Median_Annualized': sweep['Annualized'][label].median(),
+                'Median_End_Value': sweep['End_Value'][label].median(),
+                'Positive_Pct': (returns > 0).mean() * 100,
+                'Worst_Entry': returns.idxmin(),
+                'Best_Entry': returns.idxmax()
+            }
+        return pd.DataFrame.from_dict(rows, orient='index')
+
+    def _get_closes(self, data):
+        """Extract a clean close price series (handles yfinance column layouts)"""
+        closes = data['Close']
+        if isinstance(closes, pd.DataFrame):
+            closes = closes.iloc[:, 0]
+        closes = closes.astype(float).dropna()
+        return closes[closes > 0]
+
+    def _get_exit_positions(self, dates, years):
+        """Index of the first trading day on or after each entry date plus the holding period"""
+        months = int(round(years * 12))
+        targets = dates + pd.DateOffset(months=months)
+        return dates.searchsorted(targets)
+
+    def _period_label(self, years):
+        """Readable label for a holding period given in years"""
+        if float(years).is_integer():
+            return f"{int(years)}Y"
+        return f"{int(round(years * 12))}M"
@@ -0,0 +1,103 @@
+import numpy as np
+import pandas as pd
+from stock_animator.config.settings import AnimationConfig
+
+class MultiAssetPlanCalculator:
+    """
+    Savings plan over several assets with target weights and periodic rebalancing.
+
+    Shares bought are accumulated with cumulative sums over the aligned price
+    matrix; Python only loops over rebalancing dates, never over rows.
+    """
+
+    REBALANCE_FREQUENCIES = ('M', 'Q', 'Y')
+
+    def __init__(self, data_handler):
+        self.data_handler = data_handler
+        self.config = AnimationConfig
+
+    def calculate(self, prices, weights, contributions, rebalance=None):
+        """Simulate the plan and interpolate it to the target frame count"""
+        return self.data_handler.interpolate_data(
+            self.simulate(prices, weights, contributions, rebalance)
+        )
+
+    def simulate(self, prices, weights, contributions, rebalance=None):
+        """
+        Value of each position, the total and the amount invested on every trading day.
+
+        prices:        DataFrame of aligned close prices, one column per asset
+        weights:       dict of asset -> target weight (normalized internally)
+        contributions: total monthly amount split by weight, dict of asset ->
+                       monthly amount, or a DataFrame schedule of amounts per date
+        rebalance:     None, 'M', 'Q' or 'Y'
+        """
+        assets = list(prices.columns)
+        price_matrix = prices.to_numpy(dtype=float)
+        target = self._normalize_weights(weights, assets)
+
+        amounts = self._contribution_matrix(prices, target, contributions)
+        bought = amounts / price_matrix
+        shares = np.empty_like(bought)
+
+        holdings = np.zeros(len(assets))
+        for start, end in self._segments(prices.index, rebalance):
+            shares[start:end + 1] = holdings + np.cumsum(bought[start:end + 1], axis=0)
+            holdings = shares[end]
+            if end < len(prices) - 1:
+                # Rebalance at the close of the segment's last day
+                total = holdings @ price_matrix[end]
+                holdings = target * total / price_matrix[end]
+                shares[end] = holdings
+
+        values = shares * price_matrix
+        result = pd.DataFrame(values, index=prices.index, columns=assets)
+        result['Close'] = values.sum(axis=1)
+        result['Total_Invested'] = np.cumsum(amounts.sum(axis=1))
+        return result
+
+    def _normalize_weights(self, weights, assets):
+        """Target weight vector in column order"""
+        target = np.array([float(weights.get(asset, 0)) for asset in assets])
+        if (target < 0).any() or target.sum() <= 0:
+            raise ValueError("Weights must be non-negative and not all zero")
+        return target / target.sum()
+
+    def _contribution_matrix(self, prices, target, contributions):
+        """Amount invested per trading day and asset"""
+        dates = prices.index
+        amounts = np.zeros(prices.shape)
+
+        if isinstance(contributions, (pd.DataFrame, pd.Series)):
+            schedule = contributions.to_frame() if isinstance(contributions, pd.Series) else contributions
+            schedule = schedule.reindex(columns=prices.columns, fill_value=0).fillna(0)
+            # Amounts dated on non-trading days are invested on the next trading day
+            rows = dates.searchsorted(schedule.index)
+            valid = rows < len(dates)
+            np.add.at(amounts, rows[valid], schedule.to_numpy(dtype=float)[valid])
+            return amounts
+
+        if isinstance(contributions, dict):
+            monthly = np.array([float(contributions.get(asset, 0)) for asset in prices.columns])
+        else:
+            monthly = float(contributions) * target
+
+        amounts[self._first_of_period(dates, 'M')] = monthly
+        return amounts
+
+    def _segments(self, dates, rebalance):
+        """(start, end) row ranges between rebalancing days, end inclusive"""
+        if rebalance is None:
+            return [(0, len(dates) - 1)]
+        if rebalance not in self.REBALANCE_FREQUENCIES:
+            raise ValueError(f"Unknown rebalance frequency: {rebalance}")
+
+        # Rebalance on the last trading day of each period
+        starts = np.flatnonzero(self._first_of_period(dates, rebalance))
+        ends = np.r_[starts[1:] - 1, len(dates) - 1]
+        return zip(starts, ends)
+
+    def _first_of_period(self, dates, freq):
+        """Mask of the first trading day in each period"""
+        periods = dates.to_period(freq)
+        return np.r_[True, periods[1:] != periods[:-1]]
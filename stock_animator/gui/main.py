@@ -1,14 +1,16 @@
 from PyQt5.QtWidgets import (QApplication, QWidget, QVBoxLayout, QComboBox,
                              QDateEdit, QPushButton, QLabel, QLineEdit, QCheckBox, QProgressBar, QMessageBox)
-from PyQt5.QtCore import QDate, QStringListModel
+from PyQt5.QtCore import QDate, QStringListModel, QTimer
 from stock_animator.core.data_fetcher import DataHandler
+from stock_animator.core.data_cache import DataCache
 from stock_animator.core.portfolio_calculator import PortfolioCalculator
 from stock_animator.visualization.animator import AnimationBuilder
 from stock_animator.visualization.formatters import CurrencyFormatter
 from stock_animator.gui.widgets.symbol_combo_box import SymbolComboBox
 from stock_animator.core.symbol_loader import SymbolLoader
-from stock_animator.config.settings import AnimationConfig
+from stock_animator.config.settings import AnimationConfig, output_path
 from stock_animator.gui.utils.animation_worker import AnimationWorker
+from stock_animator.gui.utils.data_prefetcher import DataPrefetcher
 import os
 
 class StockAnimatorGUI(QWidget):
@@ -16,8 +18,10 @@ class StockAnimatorGUI(QWidget):
         super().__init__()
         self.config = AnimationConfig
         self.data_handler = DataHandler()
+        self.data_cache = DataCache()
+        self.prefetcher = None
+        self.pending_prefetch = None
         self.portfolio_calculator = PortfolioCalculator(self.data_handler)
-        self.animator = AnimationBuilder()
         self.symbol_loader = SymbolLoader("stock_animator/config/symbol.csv")
         self.init_symbol_selector()
         self.formatter = None
@@ -109,12 +113,71 @@ class StockAnimatorGUI(QWidget):
         self.setMinimumSize(250, 0)
         self.mode_selector.currentIndexChanged.connect(self.toggle_inputs)
 
+        # Start downloading as soon as symbol and dates settle, not on "Create Animation"
+        self.prefetch_timer = QTimer(self)
+        self.prefetch_timer.setSingleShot(True)
+        self.prefetch_timer.setInterval(self.config.PREFETCH_DELAY_MS)
+        self.prefetch_timer.timeout.connect(self.schedule_prefetch)
+        self.symbol_selector.currentIndexChanged.connect(self.restart_prefetch_timer)
+        self.start_date.dateChanged.connect(self.restart_prefetch_timer)
+        self.end_date.dateChanged.connect(self.restart_prefetch_timer)
+
     def toggle_inputs(self):
         mode_index = self.mode_selector.currentIndex()
         show_investment = mode_index in [1, 2]  # S or M
         self.investment_input.setVisible(show_investment)
         self.show_invested_check.setVisible(mode_index == 2)  # Only M
 
+    def current_data_key(self):
+        """Cache key for the selected symbol and date range"""
+        full_symbol = self.symbol_selector.currentText()
+        symbol = full_symbol.split(" - ")[0].strip()
+        if not symbol:
+            return None
+        start = self.start_date.date().toString('yyyy-MM-dd')
+        end = self.end_date.date().toString('yyyy-MM-dd')
+        return DataCache.make_key(symbol, start, end)
+
+    def restart_prefetch_timer(self, *args):
+        # Connecting signals to QTimer.start directly would pick the start(msec) overload
+        self.prefetch_timer.start()
+
+    def schedule_prefetch(self):
+        key = self.current_data_key()
+        if key is None or key in self.data_cache:
+            return
+        # One download at a time, only the latest selection is kept waiting
+        if self.prefetcher is not None and self.prefetcher.isRunning():
+            if key != self.prefetcher.key:
+                self.pending_prefetch = key
+            return
+        self.pending_prefetch = None
+        self.prefetcher = DataPrefetcher(self.data_handler, self.data_cache, key)
+        self.prefetcher.error.connect(lambda key, msg: print(f'Prefetch failed for {key[0]}: {msg}'))
+        self.prefetcher.finished.connect(self.on_prefetch_finished)
+        self.prefetcher.start()
+
+    def on_prefetch_finished(self):
+        if self.pending_prefetch is not None:
+            self.schedule_prefetch()
+
+    def load_data(self, key):
+        """Prepared data for key, from the cache, a running prefetch or a fresh download"""
+        data = self.data_cache.get(key)
+        if data is None and self.prefetcher is not None and self.prefetcher.key == key:
+            self.prefetcher.wait()
+            data = self.data_cache.get(key)
+        if data is None:
+            # Downloads are serialized in DataHandler, so this queues behind a running prefetch
+            symbol, start, end = key
+            data = self.data_handler.fetch_stock_data(symbol, start, end)
+            if data.empty:
+                raise ValueError(f"No data found for {symbol}")
+            data = self.data_handler.interpolate_data(data)
+            self.data_cache.put(key, data)
+            data = data.copy()
+        return data
+
     def start_animation(self):
         try:
             # Deactivate UI elements
@@ -126,16 +189,15 @@ class StockAnimatorGUI(QWidget):
             mode_index = self.mode_selector.currentIndex()
             mode = self.mode_mapping.get(mode_index, 'P')
             
-            full_symbol = self.symbol_selector.currentText()
-            symbol = full_symbol.split(" - ")[0].strip()
-            start = self.start_date.date().toString('yyyy-MM-dd')
-            end = self.end_date.date().toString('yyyy-MM-dd')
+            key = self.current_data_key()
+            if key is None:
+                raise ValueError("No stock symbol selected")
+            symbol = key[0]
             currency = self.currency_selector.currentText()
             
             self.formatter = CurrencyFormatter(currency)
             
-            data = self.data_handler.fetch_stock_data(symbol, start, end)
-            data = self.data_handler.interpolate_data(data)
+            data = self.load_data(key)
 
             amount = None
             if mode in ['S', 'M']:
@@ -144,9 +206,9 @@ class StockAnimatorGUI(QWidget):
                 except ValueError:
                     raise ValueError("Invalid investment amount")
 
-            # Create worker thread
+            # Create worker thread with its own renderer, so renders never share a figure
             self.worker = AnimationWorker(
-                animator=self.animator,
+                animator=AnimationBuilder(),
                 data=data,
                 symbol=symbol,
                 formatter=self.formatter,
@@ -170,13 +232,12 @@ class StockAnimatorGUI(QWidget):
         self.loading_label.setVisible(False)
         self.loading_progress.setVisible(False)
         self.generate_btn.setEnabled(True)
-        relative_path = f'{self.config.OUTPUT_DIR}/{symbol}_animation.mp4'
-        output_path = os.path.abspath(relative_path)
+        saved_path = os.path.abspath(output_path(symbol))
         # Show completion message
         QMessageBox.information(
             self, 
             "Success", 
-            f"Animation created successfully!\n\nSaved to:\n{output_path}"
+            f"Animation created successfully!\n\nSaved to:\n{saved_path}"
             )
 
     def on_animation_error(self, error_msg):
@@ -0,0 +1,20 @@
+from PyQt5.QtCore import QThread, pyqtSignal
+
+class DataPrefetcher(QThread):
+    error = pyqtSignal(tuple, str)
+
+    def __init__(self, data_handler, data_cache, key):
+        super().__init__()
+        self.data_handler = data_handler
+        self.data_cache = data_cache
+        self.key = key
+
+    def run(self):
+        try:
+            symbol, start, end = self.key
+            data = self.data_handler.fetch_stock_data(symbol, start, end)
+            if data.empty:
+                raise ValueError(f"No data found for {symbol}")
+            self.data_cache.put(self.key, self.data_handler.interpolate_data(data))
+        except Exception as e:
+            self.error.emit(self.key, str(e))
@@ -0,0 +1,244 @@
+import json
+import multiprocessing
+import os
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from stock_animator.config.settings import AnimationConfig, output_path
+from stock_animator.server import render_worker
+
+class RenderDaemon:
+    MODES = ('P', 'S', 'M')
+    CURRENCIES = ('$', '€')
+    OUTPUT_FORMATS = ('mp4', 'hls', 'fmp4')
+    # The symbol becomes part of the output path, so it must not carry separators
+    SYMBOL_PATTERN = re.compile(r'^[A-Z0-9.^=-]{1,15}$')
+
+    def __init__(self, config=AnimationConfig):
+        self.config = config
+        self.jobs = {}
+        self.finished_at = {}
+        self.changed = threading.Condition()
+        self.progress_queue = multiprocessing.Queue()
+        self.executor_lock = threading.Lock()
+        self.executor = self._start_executor()
+        threading.Thread(target=self._drain_progress, daemon=True).start()
+
+    def _start_executor(self):
+        """Start all worker processes now instead of on the first jobs"""
+        executor = ProcessPoolExecutor(
+            max_workers=self.config.DAEMON_WORKERS,
+            initializer=render_worker.init_worker,
+            initargs=(self.progress_queue,)
+        )
+        futures = [executor.submit(int) for _ in range(self.config.DAEMON_WORKERS)]
+        for future in futures:
+            future.result()
+        return executor
+
+    def submit(self, payload):
+        """Validate a job request and queue it for rendering"""
+        job = self._parse_job(payload)
+        job_id = uuid.uuid4().hex
+        # One file per job, so concurrent jobs for the same symbol never share an output
+        job['output_suffix'] = f'animation_{job_id}'
+        # Segmented outputs can be played from this path while the job is still running
+        output = os.path.abspath(output_path(job['symbol'], job['output_suffix'],
+                                             job['output_format'], self.config))
+        with self.executor_lock:
+            try:
+                future = self.executor.submit(render_worker.render_job, job_id, job)
+            except BrokenExecutor:
+                # A worker process died and took the pool with it, start a fresh one
+                self.executor.shutdown(wait=False, cancel_futures=True)
+                self.executor = self._start_executor()
+                raise
+        # Only jobs that actually reached the pool are registered
+        with self.changed:
+            self._expire_jobs()
+            self.jobs[job_id] = {'status': 'queued', 'progress': 0, 'output': output,
+                                 'output_format': job['output_format'], 'error': None}
+        future.add_done_callback(lambda f: self._on_job_done(job_id, f))
+        return job_id
+
+    def get(self, job_id):
+        """Snapshot of a job's current state"""
+        with self.changed:
+            job = self.jobs.get(job_id)
+            return dict(job) if job else None
+
+    def wait_for_change(self, job_id, last_state, timeout=30):
+        """Block until a job's state differs from last_state, None once it has expired"""
+        with self.changed:
+            self.changed.wait_for(lambda: self.jobs.get(job_id) != last_state, timeout=timeout)
+            job = self.jobs.get(job_id)
+            return dict(job) if job else None
+
+    def shutdown(self):
+        self.executor.shutdown(cancel_futures=True)
+
+    def _parse_job(self, payload):
+        """Check the request body and normalize it into a job description"""
+        missing = [key for key in ('symbol', 'start', 'end') if not payload.get(key)]
+        if missing:
+            raise ValueError(f"Missing fields: {', '.join(missing)}")
+
+        symbol = str(payload['symbol']).strip().upper()
+        if not self.SYMBOL_PATTERN.match(symbol):
+            raise ValueError(f"Invalid symbol: {symbol}")
+
+        mode = str(payload.get('mode', 'P')).upper()
+        if mode not in self.MODES:
+            raise ValueError(f"Invalid mode: {mode}")
+
+        currency = payload.get('currency', '$')
+        if currency not in self.CURRENCIES:
+            raise ValueError(f"Invalid currency: {currency}")
+
+        show_invested = payload.get('show_invested', False)
+        if not isinstance(show_invested, bool):
+            raise ValueError("show_invested must be true or false")
+
+        output_format = payload.get('output_format', self.config.OUTPUT_FORMAT)
+        if output_format not in self.OUTPUT_FORMATS:
+            raise ValueError(f"Invalid output format: {output_format}")
+
+        amount = None
+        if mode in ['S', 'M']:
+            try:
+                amount = float(payload['amount'])
+            except (KeyError, TypeError, ValueError):
+                raise ValueError("Invalid investment amount")
+            if amount <= 0:
+                raise ValueError("Investment amount must be positive")
+
+        return {
+            'symbol': symbol,
+            'start': payload['start'],
+            'end': payload['end'],
+            'mode': mode,
+            'amount': amount,
+            'currency': currency,
+            'output_format': output_format,
+            'show_invested': show_invested
+        }
+
+    def _update(self, job_id, **changes):
+        with self.changed:
+            self.jobs[job_id].update(changes)
+            self.changed.notify_all()
+
+    def _expire_jobs(self):
+        """Forget jobs that finished more than DAEMON_JOB_TTL seconds ago (lock held)"""
+        cutoff = time.monotonic() - self.config.DAEMON_JOB_TTL
+        for job_id in [job_id for job_id, done in self.finished_at.items() if done < cutoff]:
+            del self.finished_at[job_id]
+            del self.jobs[job_id]
+
+    def _drain_progress(self):
+        """Forward progress reports from the worker processes into the job table"""
+        while True:
+            job_id, progress = self.progress_queue.get()
+            with self.changed:
+                # Reports can trail behind the completion callback, check and
+                # write under one lock so a finished job is never reopened
+                if job_id in self.finished_at or job_id not in self.jobs:
+                    continue
+                self._update(job_id, status='running', progress=progress)
+
+    def _on_job_done(self, job_id, future):
+        try:
+            output = future.result()
+        except Exception as e:
+            changes = {'status': 'failed', 'error': str(e)}
+        else:
+            changes = {'status': 'finished', 'progress': 100, 'output': output}
+        with self.changed:
+            self.finished_at[job_id] = time.monotonic()
+            self._update(job_id, **changes)
+
+
+class JobRequestHandler(BaseHTTPRequestHandler):
+    """
+    POST /jobs               -> {"id": ...}
+    GET  /jobs/<id>          -> current job state
+    GET  /jobs/<id>/events   -> job state as JSON lines, streamed until it finishes
+    """
+
+    @property
+    def render_daemon(self):
+        return self.server.render_daemon
+
+    def do_POST(self):
+        if self.path.rstrip('/') != '/jobs':
+            return self._send_json(404, {'error': 'Not found'})
+        # Browsers send cross-site form posts without a preflight, JSON ones never
+        if self.headers.get_content_type() != 'application/json':
+            return self._send_json(415, {'error': 'Content-Type must be application/json'})
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            payload = json.loads(self.rfile.read(length) or b'{}')
+            job_id = self.render_daemon.submit(payload)
+        except (ValueError, AttributeError) as e:
+            return self._send_json(400, {'error': str(e)})
+        except BrokenExecutor:
+            return self._send_json(503, {'error': 'Render workers restarted, please retry'})
+        self._send_json(202, {'id': job_id})
+
+    def do_GET(self):
+        parts = self.path.strip('/').split('/')
+        events = parts[2:] == ['events']
+        if parts[0] != 'jobs' or not (len(parts) == 2 or (len(parts) == 3 and events)):
+            return self._send_json(404, {'error': 'Not found'})
+
+        job = self.render_daemon.get(parts[1])
+        if job is None:
+            return self._send_json(404, {'error': 'Unknown job'})
+        if events:
+            return self._stream_events(parts[1], job)
+        self._send_json(200, job)
+
+    def _stream_events(self, job_id, job):
+        """Push every state change until the job has finished or failed"""
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.end_headers()
+        try:
+            while job is not None:
+                self.wfile.write(json.dumps(job).encode() + b'\n')
+                self.wfile.flush()
+                if job['status'] in ('finished', 'failed'):
+                    break
+                job = self.render_daemon.wait_for_change(job_id, job)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client stopped listening, the job keeps running
+            return
+
+    def _send_json(self, status, body):
+        content = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+def serve(config=AnimationConfig):
+    """Run the render daemon until interrupted"""
+    render_daemon = RenderDaemon(config)
+    server = ThreadingHTTPServer((config.DAEMON_HOST, config.DAEMON_PORT), JobRequestHandler)
+    server.render_daemon = render_daemon
+    print(f"Render daemon listening on http://{config.DAEMON_HOST}:{config.DAEMON_PORT}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        render_daemon.shutdown()
+
+if __name__ == "__main__":
+    serve()
@@ -0,0 +1,54 @@
+import os
+from stock_animator.config.settings import output_path
+
+# Per-process state, populated once by init_worker so every job starts warm
+_data_handler = None
+_portfolio_calculator = None
+_animator = None
+_progress_queue = None
+
+def init_worker(progress_queue):
+    """Import the heavy libraries and build the figure before the first job arrives"""
+    global _data_handler, _portfolio_calculator, _animator, _progress_queue
+    from stock_animator.core.data_fetcher import DataHandler
+    from stock_animator.core.portfolio_calculator import PortfolioCalculator
+    from stock_animator.visualization.animator import AnimationBuilder
+
+    _progress_queue = progress_queue
+    _data_handler = DataHandler()
+    _portfolio_calculator = PortfolioCalculator(_data_handler)
+    _animator = AnimationBuilder()
+    _animator._setup_figure()
+
+def render_job(job_id, job):
+    """Render a single job inside a warm worker and return the output path"""
+    from stock_animator.visualization.formatters import CurrencyFormatter
+
+    symbol = job['symbol']
+    formatter = CurrencyFormatter(job['currency'])
+    data = _data_handler.fetch_stock_data(symbol, job['start'], job['end'])
+    if data.empty:
+        raise ValueError(f"No data found for {symbol}")
+    data = _data_handler.interpolate_data(data)
+
+    options = {'output_format': job['output_format'], 'output_suffix': job['output_suffix']}
+    if job['mode'] == 'S':
+        options['start_capital'] = job['amount']
+    elif job['mode'] == 'M':
+        data = _portfolio_calculator.calculate(data, job['amount'])
+        options['show_invested'] = job['show_invested']
+
+    last_progress = [-1]
+    def report(progress):
+        # Frames arrive far faster than the percentage changes
+        if progress != last_progress[0]:
+            last_progress[0] = progress
+            _progress_queue.put((job_id, progress))
+
+    _animator.progress_callback = report
+    try:
+        _animator.create_animation(data, symbol, formatter, **options)
+    finally:
+        _animator.progress_callback = None
+
+    return os.path.abspath(output_path(symbol, job['output_suffix'], job['output_format']))
@@ -1,58 +1,189 @@
 import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend
-import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 import matplotlib.dates as mdates
 import matplotlib.ticker as mticker
+import matplotlib.colors as mcolors
 import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
 from matplotlib.ticker import MaxNLocator
-from stock_animator.config.settings import AnimationConfig
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from stock_animator.config.settings import AnimationConfig, freeze_config, output_path
+from stock_animator.visualization.decimation import LineDecimator
 import numpy as np
 import os
+import shutil
 import sys
+import threading
+
+class BundledFFMpegWriter(animation.FFMpegWriter):
+    """FFmpeg writer preferring the bundled binary without touching PATH"""
+
+    @classmethod
+    def bin_path(cls):
+        if getattr(sys, 'frozen', False):
+            # Path in PyInstaller bundle
+            ffmpeg_dir = os.path.join(sys._MEIPASS, 'lib', 'ffmpeg', 'bin')
+        else:
+            # Path in normal development mode
+            ffmpeg_dir = os.path.join(os.getcwd(), 'lib', 'ffmpeg', 'bin')
+        return shutil.which('ffmpeg', path=ffmpeg_dir) or super().bin_path()
+
 
 class AnimationBuilder:
-    def __init__(self, config=AnimationConfig):
-        self.progress_callback = None
-        self.config = config
+    """
+    Renders animations on a figure owned by this instance, independent of pyplot.
+
+    Renders on the same instance are serialized; use one instance per thread to
+    render several animations in parallel.
+    """
+
+    # Outputs currently being written by any instance in this process
+    _active_outputs = set()
+    _outputs_lock = threading.Lock()
+
+    def __init__(self, config=AnimationConfig, progress_callback=None):
+        self.progress_callback = progress_callback
+        self.config = freeze_config(config)
         self.max_y = 0  # Holds the historical maximum value of the Y-axis
         self.fig = None
         self.ax = None
+        self._lock = threading.Lock()
 
     def create_animation(self, data, symbol, formatter, **options):
         """Main method to create animation"""
+        with self._lock:
+            return self._create_animation(data, symbol, formatter, **options)
+
+    def _create_animation(self, data, symbol, formatter, **options):
         self.max_y = 0  # Reset max_y for each animation
         # Add start_capital logic
         if 'start_capital' in options and options['start_capital'] is not None:
             initial_price = data['Close'].iloc[0]
-            data['Investment Value'] = (data['Close'] / initial_price) * options['start_capital']
+            # Work on a new frame, the caller's data may be shared with other jobs
+            data = data.assign(**{
+                'Investment Value': (data['Close'] / initial_price) * options['start_capital']
+            })
             options['y_data'] = 'Investment Value'  # Set y_data automatically
 
         fig, ax = self._setup_figure()
+        ax.clear()  # Drop artists left over from a previous animation
         self._style_axes(ax)
         lines, texts = self._create_artists(ax, data, options)
+        decimators = self._create_decimators(data, options)
+        if decimators[2]:
+            options['asset_floor'] = self._get_asset_floor(decimators[2])
         
         ani = animation.FuncAnimation(
             fig,
             self._update_animation,
-            fargs=(ax, data, lines, texts, formatter, options),
+            fargs=(ax, data, lines, decimators, texts, formatter, options),
             frames=self._get_frame_count(data),
             init_func=lambda: self._init_animation(ax, data, options, formatter),
             interval=1000/self.config.TARGET_FPS,
             blit=False
         )
         
-        self._save_animation(ani, symbol)
+        self._save_animation(ani, symbol,
+                             suffix=options.get('output_suffix', 'animation'),
+                             output_format=options.get('output_format'))
+        return ani
+
+    def create_sweep_animation(self, sweep, symbol, formatter, output_format=None):
+        """Create a heat-strip animation of all entry dates and holding periods"""
+        with self._lock:
+            return self._create_sweep_animation(sweep, symbol, formatter, output_format)
+
+    def _create_sweep_animation(self, sweep, symbol, formatter, output_format):
+        fig, ax = self._setup_figure()
+        ax.clear()
+        self._style_axes(ax)
+
+        annualized = sweep['Annualized'].to_numpy().T
+        end_values = sweep['End_Value'].to_numpy().T
+        labels = list(sweep['Annualized'].columns)
+        dates = sweep.index
+        frames = self._get_frame_count(sweep)
+
+        # Revealed columns are copied in incrementally, the rest stays NaN (transparent)
+        display = np.full_like(annualized, np.nan)
+        x_start, x_end = mdates.date2num(dates[0]), mdates.date2num(dates[-1])
+        limit = self.config.SWEEP_COLOR_LIMIT
+        image = ax.imshow(
+            display,
+            aspect='auto',
+            interpolation='nearest',
+            cmap=self.config.SWEEP_COLORMAP,
+            norm=mcolors.TwoSlopeNorm(vmin=-limit, vcenter=0, vmax=limit),
+            extent=(x_start, x_end, len(labels) - 0.5, -0.5)
+        )
+
+        ax.set_xlim(x_start, x_end)
+        ax.xaxis_date()
+        ax.xaxis.set_major_locator(MaxNLocator(self.config.TICK_COUNT))
+        ax.xaxis.set_major_formatter(mdates.DateFormatter('%m.%Y'))
+        ax.set_yticks(range(len(labels)))
+        ax.set_yticklabels(labels)
+
+        texts = [
+            ax.text(x_start, row, "",
+                    fontsize=self.config.FONT_SIZE,
+                    color=self.config.COLORS['axis'],
+                    fontweight='bold',
+                    va='center')
+            for row in range(len(labels))
+        ]
+        title = ax.set_title("",
+                             fontsize=self.config.FONT_SIZE,
+                             color=self.config.COLORS['text_primary'],
+                             fontweight='bold')
+        revealed = [0]
+
+        def update(frame):
+            cutoff = max(1, int(np.ceil((frame + 1) / frames * len(dates))))
+            display[:, revealed[0]:cutoff] = annualized[:, revealed[0]:cutoff]
+            revealed[0] = cutoff
+            image.set_data(display)
+
+            current = cutoff - 1
+            x_text = mdates.date2num(dates[current])
+            # Flip labels to the left of the cursor once they would run off the chart
+            align = 'left' if current < len(dates) / 2 else 'right'
+            for row, text in enumerate(texts):
+                value = end_values[row, current]
+                text.set_position((x_text, row))
+                text.set_ha(align)
+                text.set_text("" if np.isnan(value) else
+                              f" {formatter(float(value), None)} ({annualized[row, current]:+.1%} p.a.) ")
+            title.set_text(f"Entry: {dates[current]:%d.%m.%Y}")
+
+            if self.progress_callback:
+                self.progress_callback(int((frame / frames) * 100))
+            return [image, title, *texts]
+
+        ani = animation.FuncAnimation(
+            fig,
+            update,
+            frames=frames,
+            interval=1000/self.config.TARGET_FPS,
+            blit=False
+        )
+
+        self._save_animation(ani, symbol, suffix='entry_sweep', output_format=output_format)
         return ani
 
     def _setup_figure(self): 
         """Initialize matplotlib figure"""
         if self.fig is None or self.ax is None:
-            self.fig, self.ax = plt.subplots()
+            self.fig = Figure()
+            FigureCanvasAgg(self.fig)
+            self.ax = self.fig.add_subplot()
             self.fig.set_size_inches(*self.config.FIGURE_SIZE)
             self.fig.set_dpi(self.config.DPI)
             self.fig.patch.set_facecolor(self.config.COLORS['background'])
-            self.fig.autofmt_xdate()
         return self.fig, self.ax
 
     def _style_axes(self, ax):
@@ -68,6 +199,8 @@ class AnimationBuilder:
         ax.tick_params(axis='both', 
                       colors=self.config.COLORS['axis'],
                       labelsize=self.config.FONT_SIZE)
+        # Rotated date labels, applied here since ax.clear() resets them
+        ax.figure.autofmt_xdate()
 
     def _create_artists(self, ax, data, options):
         """Create plot artists with start_capital support"""
@@ -89,6 +222,8 @@ class AnimationBuilder:
                               color=self.config.COLORS['text_secondary'],
                               fontweight='bold')
             
+        asset_lines = self._create_asset_lines(ax, options)
+
         text = ax.text(
             data.index[0], 
             data[options.get('y_data', 'Close')].iloc[0], 
@@ -98,7 +233,55 @@ class AnimationBuilder:
             fontweight='bold'
         )
 
-        return (line, line_inv), (text, text_inv)
+        return (line, line_inv, asset_lines), (text, text_inv)
+
+    def _create_asset_lines(self, ax, options):
+        """Create one thinner line per asset of a multi-asset plan"""
+        assets = options.get('asset_columns') or []
+        cmap = matplotlib.colormaps[self.config.ASSET_COLORMAP]
+        asset_lines = [
+            ax.plot([], [], color=cmap(i % cmap.N), lw=1.5, alpha=0.9, label=asset)[0]
+            for i, asset in enumerate(self._get_plotted_assets(options))
+        ]
+        handles = list(asset_lines)
+        if options.get('stacked') and assets:
+            # The top band's edge is the total, drawn by the primary line
+            handles.append(Line2D([], [], color=self.config.COLORS['primary'], lw=1.5, label=assets[-1]))
+        if 0 < len(assets) <= self.config.ASSET_LEGEND_LIMIT:
+            ax.legend(handles=handles,
+                      loc='upper left',
+                      frameon=False,
+                      fontsize=self.config.FONT_SIZE,
+                      labelcolor=self.config.COLORS['axis'])
+        return asset_lines
+
+    def _get_plotted_assets(self, options):
+        """Assets drawn as their own line; stacked plots leave out the top one, which equals the total"""
+        assets = options.get('asset_columns') or []
+        return assets[:-1] if options.get('stacked') else assets
+
+    def _create_decimators(self, data, options):
+        """Create one decimator per line, sharing the date positions"""
+        x = mdates.date2num(data.index)
+        decimator = LineDecimator(x, data[options.get('y_data', 'Close')].to_numpy().ravel())
+        decimator_inv = None
+        if options.get('show_invested'):
+            decimator_inv = LineDecimator(x, data['Total_Invested'].to_numpy().ravel())
+
+        asset_decimators = []
+        assets = options.get('asset_columns') or []
+        if assets:
+            values = data[assets].to_numpy(dtype=float)
+            if options.get('stacked'):
+                # Each line marks the upper edge of its asset's band
+                values = np.cumsum(values, axis=1)
+            asset_decimators = [LineDecimator(x, values[:, i])
+                                for i in range(len(self._get_plotted_assets(options)))]
+        return decimator, decimator_inv, asset_decimators
+
+    def _get_asset_floor(self, asset_decimators):
+        """Running minimum over all asset lines, used as the lower y bound"""
+        return np.minimum.accumulate(np.vstack([d.y for d in asset_decimators]).min(axis=0))
 
     def _init_animation(self, ax, data, options, formatter):
         """Initializes the animation"""
@@ -127,9 +310,10 @@ class AnimationBuilder:
         
         return []
 
-    def _update_animation(self, frame, ax, data, lines, texts, formatter, options):
+    def _update_animation(self, frame, ax, data, lines, decimators, texts, formatter, options):
         """"Update animation for each frame"""
-        line, line_inv = lines
+        line, line_inv, asset_lines = lines
+        decimator, decimator_inv, asset_decimators = decimators
         text, text_inv = texts
         y_data = options.get('y_data', 'Close')
         start_capital = options.get('start_capital')
@@ -139,12 +323,6 @@ class AnimationBuilder:
         x_last = data.index[current_index]
         y_last = data[y_data].iloc[current_index].item()
 
-        # Update lines
-        line.set_data(data.index[:frame], data[y_data][:frame])
-        # Only show investment line if no start_capital
-        if show_invested and line_inv and not start_capital:
-            line_inv.set_data(data.index[:frame], data['Total_Invested'][:frame])
-
         x_range = ax.get_xlim()
         x_offset = (x_range[1] - x_range[0]) * 0.02
         x_text = x_last + pd.Timedelta(days=int(x_offset))
@@ -159,16 +337,28 @@ class AnimationBuilder:
             text_inv.set_text(formatter(y_inv, None))
 
         # THEN update axes (to keep text visible)
-        self._update_dynamic_axes(ax, data, frame, show_invested, y_data)
+        self._update_dynamic_axes(ax, data, frame, show_invested, y_data, options.get('asset_floor'))
+
+        # Update lines with the new x-limits, reduced to what the pixel columns can show
+        bin_width = self._get_pixel_width(ax)
+        visible = decimator.update(frame, bin_width)
+        line.set_data(decimator.x[visible], decimator.y[visible])
+        # Only show investment line if no start_capital
+        if show_invested and line_inv and not start_capital:
+            visible = decimator_inv.update(frame, bin_width)
+            line_inv.set_data(decimator_inv.x[visible], decimator_inv.y[visible])
+        for asset_line, asset_decimator in zip(asset_lines, asset_decimators):
+            visible = asset_decimator.update(frame, bin_width)
+            asset_line.set_data(asset_decimator.x[visible], asset_decimator.y[visible])
 
         # Add progress update
         if self.progress_callback:
             progress = int((frame / self._get_frame_count(data)) * 100)
             self.progress_callback(progress)
 
-        return self._get_return_elements(show_invested, line, line_inv, text, text_inv)
+        return (*self._get_return_elements(show_invested, line, line_inv, text, text_inv), *asset_lines)
 
-    def _update_dynamic_axes(self, ax, data, frame, show_invested, y_data):
+    def _update_dynamic_axes(self, ax, data, frame, show_invested, y_data, asset_floor=None):
         """Update axes dynamically based on data"""
         x_start = data.index[0]
         if frame > 1:
@@ -190,6 +380,9 @@ class AnimationBuilder:
                 min_val = min(min_val, invested_values.min().item())
                 max_val = max(max_val, invested_values.max().item())
 
+        if asset_floor is not None and frame > 0:
+            min_val = min(min_val, asset_floor[min(frame, len(asset_floor)) - 1].item())
+
         self.max_y = max(self.max_y, max_val)
         margin = (self.max_y - min_val) * self.config.Y_MARGIN_PCT
         
@@ -206,6 +399,11 @@ class AnimationBuilder:
         
         ax.set_ylim(lower_bound, upper_bound)
 
+    def _get_pixel_width(self, ax):
+        """Width of one pixel column in x data units"""
+        x_min, x_max = ax.get_xlim()
+        return (x_max - x_min) / max(ax.get_window_extent().width, 1)
+
     def _get_return_elements(self, show_invested, *elements):
         """Returns the required graphic elements"""
         return elements if show_invested else (elements[0], elements[2])
@@ -214,24 +412,92 @@ class AnimationBuilder:
         """Determines the number of frames"""
         return min(self.config.TARGET_FRAMES, len(data))
 
-    def _save_animation(self, ani, symbol):
+    def _save_animation(self, ani, symbol, suffix='animation', output_format=None):
         """Saves the animation as a video"""
-        # Path to the FFmpeg binary in the bundled program
-        if getattr(sys, 'frozen', False):
-            # Path in PyInstaller bundle
-            bundle_dir = sys._MEIPASS
-            ffmpeg_path = os.path.join(bundle_dir, 'lib', 'ffmpeg', 'bin')
-        else:
-            # Path in normal development mode
-            ffmpeg_path = os.path.join(os.getcwd(), 'lib', 'ffmpeg', 'bin')
+        output_format = output_format or self.config.OUTPUT_FORMAT
+        path = output_path(symbol, suffix, output_format, self.config)
+        with self._claim_output(path):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if output_format == 'hls':
+                self._clear_segments(path)
+            writer = BundledFFMpegWriter(fps=self.config.TARGET_FPS,
+                                         bitrate=8000,
+                                         extra_args=self._get_segment_args(path, output_format))
+
+            ani.save(str(path), 
+                    writer=writer,
+                    dpi=self.config.DPI,
+                    )
+        return path
+
+    @contextmanager
+    def _claim_output(self, path):
+        """Refuse to start a render into an output another render in this process is writing"""
+        path = path.resolve()
+        with AnimationBuilder._outputs_lock:
+            if path in AnimationBuilder._active_outputs:
+                raise ValueError(f"{path} is already being rendered")
+            AnimationBuilder._active_outputs.add(path)
+        try:
+            yield
+        finally:
+            with AnimationBuilder._outputs_lock:
+                AnimationBuilder._active_outputs.discard(path)
+
+    def _clear_segments(self, path):
+        """Drop the playlist and segments of an earlier render into this output's own directory"""
+        if path.parent.resolve() == Path(self.config.OUTPUT_DIR).resolve():
+            raise ValueError("HLS output needs its own directory")
+        # The old playlist is already marked complete, players would stop polling on it
+        path.unlink(missing_ok=True)
+        for segment in path.parent.glob('segment_*.ts'):
+            segment.unlink()
+
+    def _get_segment_args(self, path, output_format):
+        """FFmpeg arguments that make the output playable while frames are still encoded"""
+        if output_format == 'mp4':
+            return None
+        # A keyframe at every segment boundary lets each segment start on its own
+        keyframe_interval = str(int(self.config.TARGET_FPS * self.config.SEGMENT_SECONDS))
+        args = ['-g', keyframe_interval, '-keyint_min', keyframe_interval, '-sc_threshold', '0']
+        if output_format == 'fmp4':
+            return args + ['-movflags', 'frag_keyframe+empty_moov+default_base_moof']
+        if output_format == 'hls':
+            return args + [
+                '-f', 'hls',
+                '-hls_time', str(self.config.SEGMENT_SECONDS),
+                '-hls_list_size', '0',
+                '-hls_playlist_type', 'event',
+                '-hls_flags', 'temp_file',
+                '-hls_segment_filename', str(path.parent / 'segment_%05d.ts')
+            ]
+        raise ValueError(f"Unknown output format: {output_format}")
+
+
+def render_concurrently(jobs, config=AnimationConfig, max_workers=None):
+    """
+    Render several animations in parallel threads, one AnimationBuilder per job.
+
+    Each job is a dict with 'data', 'symbol', 'formatter' and optional 'options'.
+    Jobs sharing a symbol are written to {symbol}_animation_{position} unless
+    they set 'output_suffix' themselves. Returns the finished animations in job order.
+    """
+    symbols = [job['symbol'] for job in jobs]
+    job_options = []
+    for position, job in enumerate(jobs):
+        options = dict(job.get('options', {}))
+        if symbols.count(job['symbol']) > 1:
+            options.setdefault('output_suffix', f'animation_{position}')
+        job_options.append(options)
 
-        # Add FFmpeg path to PATH environment variable
-        os.environ['PATH'] = ffmpeg_path + os.pathsep + os.environ['PATH']
+    outputs = [(job['symbol'], options.get('output_suffix', 'animation'))
+               for job, options in zip(jobs, job_options)]
+    if len(set(outputs)) < len(outputs):
+        raise ValueError("Several jobs would write to the same output file")
 
-        output_path = f'{self.config.OUTPUT_DIR}/{symbol}_animation.mp4'
+    def render(job, options):
+        animator = AnimationBuilder(config, progress_callback=job.get('progress_callback'))
+        return animator.create_animation(job['data'], job['symbol'], job['formatter'], **options)
 
-        ani.save(output_path, 
-                writer='ffmpeg',
-                dpi=self.config.DPI,
-                bitrate=8000,
-                )
\ No newline at end of file
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(render, jobs, job_options))
\ No newline at end of file
@@ -0,0 +1,93 @@
+import numpy as np
+
+class LineDecimator:
+    """
+    Min/max-per-pixel-column (M4) decimation of a growing line.
+
+    Points are grouped into bins of at most one pixel column and every bin is
+    drawn with at most four vertices (first, min, max, last), which renders the
+    same image as the full path. Bins are maintained incrementally: new points
+    are appended to the existing bins and, as the x-range grows, neighbouring
+    bins are merged pairwise. Pairwise merging alone would let bins shrink to
+    half a pixel, so the series is binned again once there are more than
+    MAX_BINS_PER_PIXEL bins per column; this happens a logarithmic number of
+    times over the animation.
+    """
+
+    MAX_BINS_PER_PIXEL = 1.5
+
+    def __init__(self, x, y):
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        self._reset(None)
+
+    def update(self, count, bin_width):
+        """Return indices of the points to draw for the first `count` points"""
+        count = min(count, len(self.x))
+        if count <= 0:
+            return np.empty(0, dtype=int)
+
+        if self.bin_width is None or count < self.count or bin_width < self.bin_width:
+            # Finer resolution or a rewind cannot be derived from the bins, start over
+            self._reset(max(bin_width, np.finfo(float).eps))
+        while self.bin_width * 2 <= bin_width:
+            self._coarsen()
+        if bin_width > self.bin_width * self.MAX_BINS_PER_PIXEL:
+            self._reset(bin_width)
+        if count > self.count:
+            self._append(count)
+
+        bins = np.column_stack((self.first, self.imin, self.imax, self.last))
+        bins.sort(axis=1)
+        indices = bins.ravel()
+        # Drop repeated vertices from bins holding fewer than four distinct points
+        keep = np.ones(len(indices), dtype=bool)
+        keep[1:] = indices[1:] != indices[:-1]
+        return indices[keep]
+
+    def _reset(self, bin_width):
+        self.bin_width = bin_width
+        self.count = 0
+        self.keys = np.empty(0, dtype=np.int64)
+        self.first = np.empty(0, dtype=np.int64)
+        self.last = np.empty(0, dtype=np.int64)
+        self.imin = np.empty(0, dtype=np.int64)
+        self.imax = np.empty(0, dtype=np.int64)
+
+    def _append(self, count):
+        """Bin the points between the last update and `count`"""
+        new = np.arange(self.count, count)
+        keys = np.floor((self.x[new] - self.x[0]) / self.bin_width).astype(np.int64)
+        self._combine(
+            np.concatenate((self.keys, keys)),
+            np.concatenate((self.first, new)),
+            np.concatenate((self.last, new)),
+            np.concatenate((self.imin, new)),
+            np.concatenate((self.imax, new))
+        )
+        self.count = count
+
+    def _coarsen(self):
+        """Double the bin width by merging neighbouring bins"""
+        self.bin_width *= 2
+        self._combine(self.keys // 2, self.first, self.last, self.imin, self.imax)
+
+    def _combine(self, keys, first, last, imin, imax):
+        """Merge consecutive entries sharing a key into a single bin"""
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        ends = np.r_[starts[1:], len(keys)] - 1
+
+        self.keys = keys[starts]
+        self.first = first[starts]
+        self.last = last[ends]
+        self.imin = imin[self._reduce_arg(self.y[imin], starts, np.fmin)]
+        self.imax = imax[self._reduce_arg(self.y[imax], starts, np.fmax)]
+
+    def _reduce_arg(self, values, starts, ufunc):
+        """Position of the first extreme value within each group"""
+        extremes = np.repeat(ufunc.reduceat(values, starts), np.diff(np.r_[starts, len(values)]))
+        # Groups made up of NaNs only fall back to their first entry
+        candidates = np.flatnonzero((values == extremes) | np.isnan(extremes))
+        groups = np.searchsorted(starts, candidates, side='right') - 1
+        _, first_hit = np.unique(groups, return_index=True)
+        return candidates[first_hit]